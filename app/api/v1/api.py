@@ -1,9 +1,7 @@
-"""HTTP-слой: маршруты FastAPI, авторизация по статическому API-key и
-связывание зависимостей"""
-from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+"""HTTP-слой: маршруты FastAPI и связывание зависимостей"""
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.config import settings
 from app.core.db import get_db
 from app.repo.repositories import BuildingsRepository, OrgsRepository
 from app.schemas.schemas import GeoSearchOut, OrganizationOut
@@ -12,39 +10,21 @@ from app.services.services import OrgsService
 router = APIRouter()
 
 
-def require_api_key(
-        x_api_key: str | None = Header(default=None, alias="X-API-Key"),
-) -> None:
-    """
-        Проверяет API ключ для авторизации
-
-        Args:
-            x_api_key: Значение X-API-Key
-
-        Raises:
-            HTTPException: 401, если ключ отсутствует или неверен
-    """
-    if x_api_key != settings.api_key:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid API key",
-        )
-
-
-router.dependencies.append(Depends(require_api_key))
+_service = OrgsService(
+    orgs=OrgsRepository(),
+    buildings=BuildingsRepository(),
+)
 
 
 async def get_service() -> OrgsService:
     """
-       Экземпляр сервисного слоя для обработки запросов
+       Экземпляр сервисного слоя для обработки запросов.
+       Сервис создаётся один раз на процесс и хранит общий кэш ответов
 
        Returns:
            OrgsService: Сервис для операций с организациями/зданиями/геопоиском
     """
-    return OrgsService(
-        orgs=OrgsRepository(),
-        buildings=BuildingsRepository(),
-    )
+    return _service
 
 @router.get(
     path="/organizations/search",
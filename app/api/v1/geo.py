@@ -1,5 +1,4 @@
 """Географические утилиты для выполнения поиска"""
-import math
 from dataclasses import dataclass
 
 
@@ -11,65 +10,6 @@ class BBox:
     lon_max: float
 
 
-def haversine_m(
-        lat1: float,
-        lon1: float,
-        lat2: float,
-        lon2: float,
-) -> float:
-    """
-        Вычисляет расстояние между двумя точками на поверхности Земли
-        по формуле гаверсинуса
-
-        Args:
-            lat1: Широта первой точки
-            lon1: Долгота первой точки
-            lat2: Широта второй точки
-            lon2: Долгота второй точки
-
-        Returns:
-            float: Расстояние в метрах
-    """
-    r = 6_371_000.0
-    phi1, phi2 = math.radians(lat1), math.radians(lat2)
-    dphi = math.radians(lat2 - lat1)
-    dlambda = math.radians(lon2 - lon1)
-
-    a = (
-            math.sin(dphi / 2) ** 2
-            + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
-    )
-    return 2 * r * math.asin(math.sqrt(a))
-
-
-def bbox_for_radius(
-        lat: float,
-        lon: float,
-        radius_m: float,
-) -> BBox:
-    """
-        Строит область вокруг точки для радиусного поиска
-
-        Args:
-            lat: Широта центра
-            lon: Долгота центра
-            radius_m: Радиус поиска в метрах
-
-        Returns:
-            BBox: Прямоугольная область, содержащая круг радиуса radius_m
-    """
-    lat_delta = radius_m / 111_000.0
-    lon_delta = radius_m / (111_000.0 * max(
-        0.1, math.cos(math.radians(lat)),
-    ))
-    return BBox(
-        lat_min=lat - lat_delta,
-        lat_max=lat + lat_delta,
-        lon_min=lon - lon_delta,
-        lon_max=lon + lon_delta,
-    )
-
-
 def bbox_for_rectangle(
         lat1: float,
         lon1: float,
@@ -88,8 +28,8 @@ def bbox_for_rectangle(
        Returns:
            BBox: Нормализованный прямоугольник
     """
-    lat_min, lat_max = sorted([lat1, lat2])
-    lon_min, lon_max = sorted([lon1, lon2])
+    lat_min, lat_max = (lat1, lat2) if lat1 <= lat2 else (lat2, lat1)
+    lon_min, lon_max = (lon1, lon2) if lon1 <= lon2 else (lon2, lon1)
     return BBox(
         lat_min=lat_min,
         lat_max=lat_max,
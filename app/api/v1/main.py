@@ -2,12 +2,30 @@
 from fastapi import FastAPI
 
 from app.api.v1.api import router
+from app.core.security import ApiKeyMiddleware, install_api_key_openapi
+
+# Пути, доступные без API key
+PUBLIC_PATHS = frozenset({
+    "/health",
+    "/docs",
+    "/docs/oauth2-redirect",
+    "/redoc",
+    "/openapi.json",
+})
 
 app = FastAPI(
     title="Organizations API",
     description="API для организаций/зданий/деятельностей. Авторизация: X-API-Key.",
 )
 app.include_router(router)
+app.add_middleware(
+    ApiKeyMiddleware,
+    public_paths=PUBLIC_PATHS,
+)
+install_api_key_openapi(
+    app=app,
+    public_paths=PUBLIC_PATHS,
+)
 
 
 @app.get(path="/health", tags=["health"], summary="Health check")
@@ -0,0 +1,152 @@
+"""In-process кэш результатов сервисного слоя"""
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from functools import wraps
+from typing import Any, Concatenate, ParamSpec, Protocol, TypeVar
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+        LRU-кэш с ограниченным временем жизни записей.
+        Размер ограничивается суммарным весом записей, а не их числом,
+        поэтому крупные ответы вытесняют больше старых записей
+
+        Args:
+            maxsize: Максимальный суммарный вес записей, старые вытесняются первыми
+            ttl: Время жизни записи в секундах
+            weigh: Функция веса значения, по умолчанию каждая запись весит 1
+            clock: Источник времени в секундах, по умолчанию time.monotonic
+    """
+    def __init__(
+            self,
+            maxsize: int,
+            ttl: float,
+            weigh: Callable[[Any], int] = lambda value: 1,
+            clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.weigh = weigh
+        self.clock = clock
+        self._data: OrderedDict[Hashable, tuple[float, int, Any]] = OrderedDict()
+        self._weight = 0
+
+    def get(
+            self,
+            key: Hashable,
+            default: Any = None,
+    ) -> Any:
+        """
+            Возвращает значение по ключу, если запись есть и не устарела
+
+            Args:
+                key: Ключ записи
+                default: Значение при промахе
+
+            Returns:
+                Any: Закэшированное значение или default
+        """
+        item = self._data.get(key)
+        if item is None:
+            return default
+
+        expires_at, _, value = item
+        if expires_at < self.clock():
+            self._pop(key)
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(
+            self,
+            key: Hashable,
+            value: Any,
+    ) -> None:
+        """
+            Сохраняет значение, вытесняя самые давние записи, пока суммарный
+            вес не уложится в maxsize. Значение тяжелее maxsize не сохраняется
+
+            Args:
+                key: Ключ записи
+                value: Значение
+        """
+        self._pop(key)
+        weight = self.weigh(value)
+        if weight > self.maxsize:
+            return
+
+        self._data[key] = (self.clock() + self.ttl, weight, value)
+        self._weight += weight
+        while self._weight > self.maxsize:
+            self._pop(next(iter(self._data)))
+
+    def clear(self) -> None:
+        """Удаляет все записи"""
+        self._data.clear()
+        self._weight = 0
+
+    def _pop(
+            self,
+            key: Hashable,
+    ) -> None:
+        """
+            Удаляет запись, если она есть, и вычитает её вес
+
+            Args:
+                key: Ключ записи
+        """
+        item = self._data.pop(key, None)
+        if item is not None:
+            self._weight -= item[1]
+
+
+class HasCache(Protocol):
+    """Объект, хранящий собственный TTLCache"""
+    cache: TTLCache
+
+
+S = TypeVar("S", bound=HasCache)
+
+
+def cached(
+        key: Callable[..., Hashable],
+) -> Callable[
+    [Callable[Concatenate[S, P], Awaitable[R]]],
+    Callable[Concatenate[S, P], Awaitable[R]],
+]:
+    """
+        Кэширует результат async-метода в self.cache.
+        Ключ строится только из бизнес-параметров, поэтому сессия БД
+        и прочие зависимости в него не попадают
+
+        Args:
+            key: Функция, получающая аргументы метода(кроме self)
+                и возвращающая ключ кэша
+
+        Returns:
+            Callable: Декоратор метода
+    """
+    def decorator(
+            func: Callable[Concatenate[S, P], Awaitable[R]],
+    ) -> Callable[Concatenate[S, P], Awaitable[R]]:
+        @wraps(func)
+        async def wrapper(self: S, /, *args: P.args, **kwargs: P.kwargs) -> R:
+            cache_key = (func.__name__, key(*args, **kwargs))
+            hit = self.cache.get(cache_key, _MISSING)
+            if hit is not _MISSING:
+                return hit  # type: ignore[no-any-return]
+
+            value = await func(self, *args, **kwargs)
+            self.cache.set(cache_key, value)
+            return value
+
+        return wrapper
+
+    return decorator
@@ -11,7 +11,11 @@ from app.core.config import settings
 
 engine = create_async_engine(
     url=settings.database_url,
+    pool_size=20,
+    max_overflow=10,
     pool_pre_ping=True,
+    pool_recycle=3600,
+    query_cache_size=1200,
 )
 SessionLocal = async_sessionmaker(
     bind=engine,
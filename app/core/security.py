@@ -0,0 +1,124 @@
+"""Авторизация HTTP-запросов по статическому API-key"""
+import hmac
+from typing import Any
+
+from fastapi import FastAPI
+from starlette.responses import JSONResponse
+from starlette.routing import Match
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import settings
+
+API_KEY_HEADER = "X-API-Key"
+_API_KEY_HEADER_RAW = API_KEY_HEADER.lower().encode()
+_API_KEY_SCHEME = "ApiKeyHeader"
+
+
+class ApiKeyMiddleware:
+    """
+        ASGI-middleware, проверяющий заголовок X-API-Key до маршрутизации
+
+        Args:
+            app: Оборачиваемое ASGI-приложение
+            public_paths: Пути, доступные без API key
+    """
+    def __init__(
+            self,
+            app: ASGIApp,
+            public_paths: frozenset[str] = frozenset(),
+    ) -> None:
+        self.app = app
+        self.public_paths = public_paths
+
+    async def __call__(
+            self,
+            scope: Scope,
+            receive: Receive,
+            send: Send,
+    ) -> None:
+        """
+            Пропускает запрос дальше, если ключ совпадает с настроенным.
+            Сравнение выполняется за постоянное время. Запрос, для которого
+            в приложении нет маршрута с таким путём и методом, пропускается
+            без проверки, чтобы роутер вернул 404 или 405
+
+            Args:
+                scope: ASGI scope запроса
+                receive: ASGI receive-канал
+                send: ASGI send-канал
+        """
+        if scope["type"] != "http" or scope["path"] in self.public_paths:
+            await self.app(scope, receive, send)
+            return
+
+        api_key = next(
+            (value for name, value in scope["headers"] if name == _API_KEY_HEADER_RAW),
+            None,
+        )
+        if (api_key is None or not hmac.compare_digest(
+            api_key,
+            settings.api_key.encode(),
+        )) and _has_route(scope):
+            response = JSONResponse(
+                status_code=401,
+                content={"detail": "Invalid API key"},
+            )
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
+
+
+def _has_route(scope: Scope) -> bool:
+    """
+        Проверяет, обслуживает ли приложение путь и метод запроса
+
+        Args:
+            scope: ASGI scope запроса
+
+        Returns:
+            bool: True, если запрос полностью совпадает хотя бы с одним маршрутом
+    """
+    return any(
+        route.matches(scope)[0] == Match.FULL
+        for route in scope["app"].routes
+    )
+
+
+def install_api_key_openapi(
+        app: FastAPI,
+        public_paths: frozenset[str] = frozenset(),
+) -> None:
+    """
+        Описывает проверку ApiKeyMiddleware в OpenAPI-схеме: схема apiKey
+        в заголовке X-API-Key требуется глобально, публичные пути её отменяют.
+        Схема дополняет стандартную FastAPI.openapi, поэтому servers,
+        openapi_tags и прочие настройки приложения сохраняются.
+        Без этого /docs не знает о заголовке и "Try it out" получает 401
+
+        Args:
+            app: FastAPI-приложение
+            public_paths: Пути, доступные без API key
+    """
+    def openapi() -> dict[str, Any]:
+        if app.openapi_schema:
+            return app.openapi_schema
+
+        # FastAPI.openapi сам кэширует схему в app.openapi_schema, дополнения
+        # ниже меняют тот же объект
+        schema = FastAPI.openapi(app)
+        schema.setdefault("components", {})["securitySchemes"] = {
+            _API_KEY_SCHEME: {
+                "type": "apiKey",
+                "in": "header",
+                "name": API_KEY_HEADER,
+            },
+        }
+        schema["security"] = [{_API_KEY_SCHEME: []}]
+        for path, operations in schema.get("paths", {}).items():
+            if path in public_paths:
+                for operation in operations.values():
+                    operation["security"] = []
+        return schema
+
+    app.openapi = openapi  # type: ignore[method-assign]
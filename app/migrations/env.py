@@ -1,7 +1,10 @@
+import asyncio
 from logging.config import fileConfig
 
 from alembic import context
-from sqlalchemy import engine_from_config, pool
+from sqlalchemy import pool
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import async_engine_from_config
 
 import app.models.models  # noqa: F401
 from app.core.config import settings
@@ -51,29 +54,43 @@ def run_migrations_offline() -> None:
         context.run_migrations()
 
 
-def run_migrations_online() -> None:
-    """Run migrations in 'online' mode.
+def do_run_migrations(connection: Connection) -> None:
+    """Run migrations on a sync facade of the async connection."""
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
 
-    In this scenario we need to create an Engine
-    and associate a connection with the context.
+
+async def run_async_migrations() -> None:
+    """Create an async Engine for the application's async database URL
+    and run the migrations through run_sync.
 
     """
-    connectable = engine_from_config(
+    connectable = async_engine_from_config(
         config.get_section(config.config_ini_section, default={}),
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
         url=settings.database_url,
     )
 
-    with connectable.connect() as connection:
-        context.configure(
-            connection=connection,
-            target_metadata=target_metadata,
-        )
+    async with connectable.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+
+    await connectable.dispose()
 
-        with context.begin_transaction():
-            context.run_migrations()
 
+def run_migrations_online() -> None:
+    """Run migrations in 'online' mode.
+
+    The application uses an async driver(asyncpg), so the Engine is
+    async as well.
+
+    """
+    asyncio.run(run_async_migrations())
 
 if context.is_offline_mode():
     run_migrations_offline()
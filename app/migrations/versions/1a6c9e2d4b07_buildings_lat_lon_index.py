@@ -0,0 +1,38 @@
+"""buildings lat/lon index
+
+Revision ID: 1a6c9e2d4b07
+Revises: e7a3f1b5c842
+Create Date: 2026-10-15 12:50:00.000000
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '1a6c9e2d4b07'
+down_revision: str | Sequence[str] | None = 'e7a3f1b5c842'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'buildings_lat_lon_idx',
+            'buildings',
+            ['lat', 'lon'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'buildings_lat_lon_idx',
+            table_name='buildings',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,72 @@
+"""initial schema
+
+Revision ID: 3f9a1c2b7d10
+Revises:
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9a1c2b7d10'
+down_revision: str | Sequence[str] | None = None
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'activities',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=255), nullable=False),
+        sa.Column('parent_id', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['parent_id'], ['activities.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_table(
+        'buildings',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('address', sa.String(length=255), nullable=False),
+        sa.Column('lat', sa.Float(), nullable=False),
+        sa.Column('lon', sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_table(
+        'organizations',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=255), nullable=False),
+        sa.Column('building_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['building_id'], ['buildings.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_table(
+        'organization_activities',
+        sa.Column('organization_id', sa.Integer(), nullable=False),
+        sa.Column('activity_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['activity_id'], ['activities.id']),
+        sa.ForeignKeyConstraint(['organization_id'], ['organizations.id']),
+        sa.PrimaryKeyConstraint('organization_id', 'activity_id'),
+        sa.UniqueConstraint('organization_id', 'activity_id', name='uq_org_activity'),
+    )
+    op.create_table(
+        'organization_phones',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('organization_id', sa.Integer(), nullable=False),
+        sa.Column('phone', sa.String(length=32), nullable=False),
+        sa.ForeignKeyConstraint(['organization_id'], ['organizations.id']),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('organization_id', 'phone', name='uq_org_phone'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('organization_phones')
+    op.drop_table('organization_activities')
+    op.drop_table('organizations')
+    op.drop_table('buildings')
+    op.drop_table('activities')
@@ -0,0 +1,38 @@
+"""organizations building_id index
+
+Revision ID: 5e0b8c3d9f72
+Revises: c41d7e9a2f58
+Create Date: 2026-10-15 12:30:00.000000
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '5e0b8c3d9f72'
+down_revision: str | Sequence[str] | None = 'c41d7e9a2f58'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'organizations_building_id_idx',
+            'organizations',
+            ['building_id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'organizations_building_id_idx',
+            table_name='organizations',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,42 @@
+"""organizations name trigram index
+
+Revision ID: 8b2e4d6f0a31
+Revises: 3f9a1c2b7d10
+Create Date: 2026-10-15 12:10:00.000000
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '8b2e4d6f0a31'
+down_revision: str | Sequence[str] | None = '3f9a1c2b7d10'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'organizations_name_trgm',
+            'organizations',
+            ['name'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'name': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'organizations_name_trgm',
+            table_name='organizations',
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+        )
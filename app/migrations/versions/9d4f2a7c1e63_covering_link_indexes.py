@@ -0,0 +1,52 @@
+"""covering indexes on organization phones/activities
+
+Revision ID: 9d4f2a7c1e63
+Revises: 1a6c9e2d4b07
+Create Date: 2026-10-15 13:10:00.000000
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4f2a7c1e63'
+down_revision: str | Sequence[str] | None = '1a6c9e2d4b07'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'organization_phones_org_id_cover_idx',
+            'organization_phones',
+            ['organization_id', 'id'],
+            unique=False,
+            postgresql_include=['phone'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'organization_activities_activity_id_cover_idx',
+            'organization_activities',
+            ['activity_id'],
+            unique=False,
+            postgresql_include=['organization_id'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'organization_activities_activity_id_cover_idx',
+            table_name='organization_activities',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'organization_phones_org_id_cover_idx',
+            table_name='organization_phones',
+            postgresql_concurrently=True,
+        )
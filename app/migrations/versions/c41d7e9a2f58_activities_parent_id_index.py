@@ -0,0 +1,38 @@
+"""activities parent_id index
+
+Revision ID: c41d7e9a2f58
+Revises: 8b2e4d6f0a31
+Create Date: 2026-10-15 12:20:00.000000
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41d7e9a2f58'
+down_revision: str | Sequence[str] | None = '8b2e4d6f0a31'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'activities_parent_id_idx',
+            'activities',
+            ['parent_id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'activities_parent_id_idx',
+            table_name='activities',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,43 @@
+"""buildings earthdistance index
+
+Revision ID: e7a3f1b5c842
+Revises: 5e0b8c3d9f72
+Create Date: 2026-10-15 12:40:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7a3f1b5c842'
+down_revision: str | Sequence[str] | None = '5e0b8c3d9f72'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS cube')
+    op.execute('CREATE EXTENSION IF NOT EXISTS earthdistance')
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'buildings_earth_gix',
+            'buildings',
+            [sa.text('ll_to_earth(lat, lon)')],
+            unique=False,
+            postgresql_using='gist',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'buildings_earth_gix',
+            table_name='buildings',
+            postgresql_using='gist',
+            postgresql_concurrently=True,
+        )
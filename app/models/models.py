@@ -1,7 +1,15 @@
 """ORM-модели"""
 from __future__ import annotations
 
-from sqlalchemy import ForeignKey, String, UniqueConstraint
+from sqlalchemy import (
+    DDL,
+    ForeignKey,
+    Index,
+    String,
+    UniqueConstraint,
+    event,
+    text,
+)
 from sqlalchemy.orm import (
     DeclarativeBase,
     Mapped,
@@ -15,6 +23,15 @@ class Base(DeclarativeBase):
     pass
 
 
+# Расширения, от которых зависят индексы схемы(нужны и для create_all)
+for _extension in ("pg_trgm", "cube", "earthdistance"):
+    event.listen(
+        Base.metadata,
+        "before_create",
+        DDL(f"CREATE EXTENSION IF NOT EXISTS {_extension}"),  # type: ignore[no-untyped-call]
+    )
+
+
 class Building(Base):
     """
        Здание(точка на карте + адрес)
@@ -27,6 +44,18 @@ class Building(Base):
            organizations: Организации, находящиеся в здании
     """
     __tablename__ = "buildings"
+    __table_args__ = (
+        Index(
+            "buildings_earth_gix",
+            text("ll_to_earth(lat, lon)"),
+            postgresql_using="gist",
+        ),
+        Index(
+            "buildings_lat_lon_idx",
+            "lat",
+            "lon",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     address: Mapped[str] = mapped_column(
@@ -55,6 +84,18 @@ class Organization(Base):
             activities: Виды деятельности
     """
     __tablename__ = "organizations"
+    __table_args__ = (
+        Index(
+            "organizations_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "organizations_building_id_idx",
+            "building_id",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(
@@ -89,10 +130,18 @@ class OrganizationPhone(Base):
             organization: ORM-ссылка на организацию
     """
     __tablename__ = "organization_phones"
-    __table_args__ = (UniqueConstraint(
-        "organization_id",
-        "phone",
-        name="uq_org_phone"),
+    __table_args__ = (
+        UniqueConstraint(
+            "organization_id",
+            "phone",
+            name="uq_org_phone",
+        ),
+        Index(
+            "organization_phones_org_id_cover_idx",
+            "organization_id",
+            "id",
+            postgresql_include=["phone"],
+        ),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
@@ -122,6 +171,10 @@ class Activity(Base):
             organizations: Организации, у которых есть этот вид деятельности
     """
     __tablename__ = "activities"
+    __table_args__ = (Index(
+        "activities_parent_id_idx",
+        "parent_id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(
@@ -148,10 +201,17 @@ class Activity(Base):
 class OrganizationActivity(Base):
     """Связующая таблица для связи M:N"""
     __tablename__ = "organization_activities"
-    __table_args__ = (UniqueConstraint(
-        "organization_id",
-        "activity_id",
-        name="uq_org_activity"),
+    __table_args__ = (
+        UniqueConstraint(
+            "organization_id",
+            "activity_id",
+            name="uq_org_activity",
+        ),
+        Index(
+            "organization_activities_activity_id_cover_idx",
+            "activity_id",
+            postgresql_include=["organization_id"],
+        ),
     )
 
     organization_id: Mapped[int] = mapped_column(
@@ -1,10 +1,230 @@
 """Слой доступа к данным"""
-from sqlalchemy import select, text
+from collections.abc import AsyncIterator, Sequence
+from typing import Any
+
+from sqlalchemy import (
+    ColumnElement,
+    Float,
+    Row,
+    Select,
+    String,
+    bindparam,
+    func,
+    select,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import (
+    contains_eager,
+    joinedload,
+    load_only,
+    raiseload,
+    selectinload,
+)
 
 from app.api.v1.geo import BBox
-from app.models.models import Activity, Building, Organization
+from app.models.models import (
+    Activity,
+    Building,
+    Organization,
+    OrganizationActivity,
+    OrganizationPhone,
+)
+
+# Загружаются только колонки, нужные для OrganizationOut
+_ORG_LOAD_OPTIONS = (
+    load_only(
+        Organization.id,
+        Organization.name,
+        Organization.building_id,
+    ),
+    joinedload(Organization.building).load_only(
+        Building.id,
+        Building.address,
+        Building.lat,
+        Building.lon,
+    ),
+    selectinload(Organization.phones).load_only(OrganizationPhone.phone),
+    selectinload(Organization.activities).load_only(Activity.name),
+    raiseload("*"),
+)
+
+# Размер пачки строк, которую server-side курсор отдаёт за одну выборку
+_STREAM_YIELD_PER = 500
+
+_OrgColumns = tuple[int, str, int, str, float, float, Sequence[str], Sequence[str]]
+OrgRow = Row[_OrgColumns]
+
+
+def _org_rows_select() -> Select[_OrgColumns]:
+    """
+        Core-запрос плоских строк организации для списковых эндпоинтов:
+        здание через JOIN, телефоны и активности агрегируются в массивы
+        коррелированными подзапросами, без гидрации ORM-объектов
+
+        Returns:
+            Select: Запрос колонок id, name, building_id, address, lat, lon,
+                phones, activities
+    """
+    phones = (
+        select(OrganizationPhone.phone)
+        .where(OrganizationPhone.organization_id == Organization.id)
+        .order_by(OrganizationPhone.id)
+        .scalar_subquery()
+    )
+    activities = (
+        select(Activity.name)
+        .join(OrganizationActivity, OrganizationActivity.activity_id == Activity.id)
+        .where(OrganizationActivity.organization_id == Organization.id)
+        .order_by(Activity.id)
+        .scalar_subquery()
+    )
+    return select(
+        Organization.id,
+        Organization.name,
+        Building.id.label("building_id"),
+        Building.address,
+        Building.lat,
+        Building.lon,
+        func.array(phones, type_=ARRAY(String)).label("phones"),
+        func.array(activities, type_=ARRAY(String)).label("activities"),
+    ).join(Building, Building.id == Organization.building_id)
+
+
+def _orgs_by_activity_tree_select() -> Select[_OrgColumns]:
+    """
+        Запрос организаций, связанных с активностью :root_activity_id и её
+        дочерними до глубины 3. Уровни дерева разворачиваются тремя явными CTE
+        (индексный поиск по activities.parent_id на каждый уровень).
+        Организации отбираются через id IN (подзапрос по связующей таблице),
+        поэтому дубликаты не появляются и DISTINCT не нужен
+
+        Returns:
+            Select: Запрос строк организаций
+    """
+    level1 = (
+        select(Activity.id)
+        .where(Activity.id == bindparam("root_activity_id"))
+        .cte(name="level1")
+    )
+    level2 = (
+        select(Activity.id)
+        .join(level1, Activity.parent_id == level1.c.id)
+        .cte(name="level2")
+    )
+    level3 = (
+        select(Activity.id)
+        .join(level2, Activity.parent_id == level2.c.id)
+        .cte(name="level3")
+    )
+    tree = union_all(
+        select(level1.c.id),
+        select(level2.c.id),
+        select(level3.c.id),
+    ).cte(name="tree")
+    org_ids = select(OrganizationActivity.organization_id).where(
+        OrganizationActivity.activity_id.in_(select(tree.c.id)),
+    )
+    return _org_rows_select().where(Organization.id.in_(org_ids))
+
+
+def _buildings_with_orgs_select(
+        *criteria: ColumnElement[bool],
+) -> Select[tuple[Building, Organization]]:
+    """
+        Запрос зданий, подходящих под условия, вместе с их организациями
+        одним LEFT JOIN, здания без организаций тоже попадают в выборку
+
+        Args:
+            criteria: Условия отбора зданий
+
+        Returns:
+            Select: Запрос пар здание/организация
+    """
+    return (
+        select(Building, Organization)
+        .outerjoin(Organization, Organization.building_id == Building.id)
+        .where(*criteria)
+        .options(
+            load_only(
+                Organization.id,
+                Organization.name,
+                Organization.building_id,
+            ),
+            contains_eager(Organization.building),
+            selectinload(Organization.phones).load_only(OrganizationPhone.phone),
+            selectinload(Organization.activities).load_only(Activity.name),
+            raiseload("*"),
+        )
+    )
+
+
+# Запросы собираются один раз при импорте, значения передаются через bindparam
+_GET_ORG_STMT = (
+    select(Organization)
+    .where(Organization.id == bindparam("org_id"))
+    .options(*_ORG_LOAD_OPTIONS)
+)
+_ACTIVITY_EXISTS_STMT = select(Activity.id).where(
+    Activity.id == bindparam("activity_id"),
+)
+_ORGS_BY_NAME_STMT = (
+    _org_rows_select()
+    .where(Organization.name.ilike(bindparam("pattern")))
+    .execution_options(yield_per=_STREAM_YIELD_PER)
+)
+_ORGS_IN_BUILDING_STMT = (
+    _org_rows_select()
+    .where(Organization.building_id == bindparam("building_id"))
+    .execution_options(yield_per=_STREAM_YIELD_PER)
+)
+_ORGS_BY_ACTIVITY_TREE_STMT = _orgs_by_activity_tree_select().execution_options(
+    yield_per=_STREAM_YIELD_PER,
+)
+_BUILDINGS_IN_BBOX_STMT = _buildings_with_orgs_select(
+    Building.lat.between(bindparam("lat_min"), bindparam("lat_max")),
+    Building.lon.between(bindparam("lon_min"), bindparam("lon_max")),
+)
+# earthdistance считает на сфере радиусом earth()(по умолчанию 6378168 м);
+# радиус поиска задан для среднего радиуса Земли 6371000 м(как в прежнем
+# haversine), поэтому r_m масштабируется в SQL на earth() / 6371000, и граница
+# круга остаётся верной, даже если earth() переопределена в базе
+_MEAN_EARTH_RADIUS_M = 6_371_000
+_center = func.ll_to_earth(
+    bindparam("lat", type_=Float),
+    bindparam("lon", type_=Float),
+)
+_point = func.ll_to_earth(Building.lat, Building.lon)
+_radius = (
+    bindparam("r_m", type_=Float) * func.earth(type_=Float) / _MEAN_EARTH_RADIUS_M
+)
+_BUILDINGS_IN_RADIUS_STMT = _buildings_with_orgs_select(
+    func.earth_box(_center, _radius).op("@>", is_comparison=True)(_point),
+    func.earth_distance(_center, _point) <= _radius,
+)
+
+
+async def _stream_org_rows(
+        db: AsyncSession,
+        stmt: Select[_OrgColumns],
+        params: dict[str, Any],
+) -> AsyncIterator[OrgRow]:
+    """
+        Отдаёт строки организаций через server-side курсор пачками
+        по _STREAM_YIELD_PER, не держа в памяти весь результат
+
+        Args:
+            db: SQLAlchemy-сессия
+            stmt: Запрос, построенный на _org_rows_select
+            params: Значения bindparam запроса
+
+        Yields:
+            OrgRow: Строка организации
+    """
+    result = await db.stream(stmt, params)
+    async for row in result:
+        yield row
 
 
 class OrgsRepository:
@@ -24,23 +244,14 @@ class OrgsRepository:
             Returns:
                 Organization | None: ORM-объект или None
         """
-        stmt = (
-            select(Organization)
-            .where(Organization.id == org_id)
-            .options(
-                selectinload(Organization.building),
-                selectinload(Organization.phones),
-                selectinload(Organization.activities),
-            )
-        )
-        result = await db.execute(stmt)
+        result = await db.execute(_GET_ORG_STMT, {"org_id": org_id})
         return result.scalar_one_or_none()
 
     @staticmethod
     async def search_orgs_by_name(
             db: AsyncSession,
             q: str,
-    ) -> list[Organization]:
+    ) -> AsyncIterator[OrgRow]:
         """
             Поиск организаций по части названия
 
@@ -48,26 +259,18 @@ class OrgsRepository:
                 db: SQLAlchemy-сессия
                 q: Поисковая строка
 
-            Returns:
-                list[Organization]: Список ORM-сущностей
+            Yields:
+                OrgRow: Строка организации
         """
-        stmt = (
-            select(Organization)
-            .where(Organization.name.ilike(f"%{q}%"))
-            .options(
-                selectinload(Organization.building),
-                selectinload(Organization.phones),
-                selectinload(Organization.activities),
-            )
-        )
-        result = await db.execute(stmt)
-        return list(result.scalars().all())
+        params = {"pattern": f"%{q}%"}
+        async for row in _stream_org_rows(db, _ORGS_BY_NAME_STMT, params):
+            yield row
 
     @staticmethod
     async def orgs_in_building(
             db: AsyncSession,
             building_id: int,
-    ) -> list[Organization]:
+    ) -> AsyncIterator[OrgRow]:
         """
             Возвращает все организации в указанном здании
 
@@ -75,40 +278,12 @@ class OrgsRepository:
                 db: SQLAlchemy-сессия
                 building_id: ID здания
 
-            Returns:
-                list[Organization]: Организации в здании
+            Yields:
+                OrgRow: Строка организации в здании
         """
-        stmt = (
-            select(Organization)
-            .where(Organization.building_id == building_id)
-            .options(
-                selectinload(Organization.building),
-                selectinload(Organization.phones),
-                selectinload(Organization.activities),
-            )
-        )
-        result = await db.execute(stmt)
-        return list(result.scalars().all())
-
-    @staticmethod
-    async def orgs_by_building_ids(
-            db: AsyncSession,
-            building_ids: list[int],
-    ) -> list[Organization]:
-        if not building_ids:
-            return []
-
-        stmt = (
-            select(Organization)
-            .where(Organization.building_id.in_(building_ids))
-            .options(
-                selectinload(Organization.building),
-                selectinload(Organization.phones),
-                selectinload(Organization.activities),
-            )
-        )
-        result = await db.execute(stmt)
-        return list(result.scalars().all())
+        params = {"building_id": building_id}
+        async for row in _stream_org_rows(db, _ORGS_IN_BUILDING_STMT, params):
+            yield row
 
     @staticmethod
     async def activity_exists(
@@ -125,99 +300,87 @@ class OrgsRepository:
             Returns:
                 bool: True если существует
            """
-        stmt = select(Activity.id).where(Activity.id == activity_id)
-        result = await db.execute(stmt)
+        result = await db.execute(
+            _ACTIVITY_EXISTS_STMT,
+            {"activity_id": activity_id},
+        )
         return result.scalar_one_or_none() is not None
 
     @staticmethod
-    async def activity_descendants_ids(
+    async def orgs_by_activity_tree(
             db: AsyncSession,
             root_activity_id: int,
-    ) -> list[int]:
+    ) -> AsyncIterator[OrgRow]:
         """
-            Возвращает список ID активности и её дочерних до глубины 3
+            Возвращает организации, связанные с активностью и её дочерними
+            до глубины 3, одним запросом(см. _orgs_by_activity_tree_select),
+            без промежуточной выгрузки ID в приложение
 
             Args:
                 db: SQLAlchemy-сессия
                 root_activity_id: ID корневой активности
 
-            Returns:
-                list[int]: ID всех найденных активностей
+            Yields:
+                OrgRow: Строка организации
         """
-        sql = text(
-            """
-            WITH RECURSIVE tree AS (
-                SELECT id, parent_id, 1 AS depth
-                FROM activities
-                WHERE id = :root_id
-                UNION ALL
-                SELECT a.id, a.parent_id, t.depth + 1
-                FROM activities a
-                JOIN tree t ON a.parent_id = t.id
-                WHERE t.depth < 3
-            )
-            SELECT id FROM tree;
-            """
-        )
-        result = await db.execute(
-            statement=sql,
-            params={"root_id": root_activity_id},
-        )
-        rows = result.all()
-        return [int(r[0]) for r in rows]
+        params = {"root_activity_id": root_activity_id}
+        async for row in _stream_org_rows(db, _ORGS_BY_ACTIVITY_TREE_STMT, params):
+            yield row
 
+
+class BuildingsRepository:
+    """Репозиторий для работы со зданиями"""
     @staticmethod
-    async def orgs_by_activity_ids(
+    async def buildings_with_orgs_in_bbox(
             db: AsyncSession,
-            activity_ids: list[int],
-    ) -> list[Organization]:
+            bbox: BBox,
+    ) -> list[tuple[Building, Organization | None]]:
         """
-            Возвращает организации, связанные с заданными ID активностей
+            Возвращает здания внутри заданного прямоугольника и их организации
+            (здания без организаций тоже попадают в выборку)
 
             Args:
                 db: SQLAlchemy-сессия
-                activity_ids: Список ID активностей
+                bbox: Объект с координатными границами
 
             Returns:
-                list[Organization]: Список организаций
+                list[tuple[Building, Organization | None]]: Пары здание/организация
         """
-        if not activity_ids:
-            return []
-        stmt = (
-            select(Organization)
-            .join(Organization.activities)
-            .where(Activity.id.in_(activity_ids))
-            .options(
-                selectinload(Organization.building),
-                selectinload(Organization.phones),
-                selectinload(Organization.activities),
-            )
-            .distinct()
+        result = await db.execute(
+            _BUILDINGS_IN_BBOX_STMT,
+            {
+                "lat_min": bbox.lat_min,
+                "lat_max": bbox.lat_max,
+                "lon_min": bbox.lon_min,
+                "lon_max": bbox.lon_max,
+            },
         )
-        result = await db.execute(stmt)
-        return list(result.scalars().all())
+        return list(result.tuples().all())
 
-
-class BuildingsRepository:
-    """Репозиторий для работы со зданиями"""
     @staticmethod
-    async def buildings_in_bbox(
+    async def buildings_with_orgs_in_radius(
             db: AsyncSession,
-            bbox: BBox,
-    ) -> list[Building]:
+            lat: float,
+            lon: float,
+            r_m: float,
+    ) -> list[tuple[Building, Organization | None]]:
         """
-            Возвращает здания внутри заданного прямоугольника
+            Возвращает здания в радиусе r_m метров от точки и их организации.
+            Кандидатов отбирает earth_box по GiST-индексу buildings_earth_gix,
+            точное расстояние проверяет earth_distance(расширение earthdistance).
+            Расстояние считается по среднему радиусу Земли 6371000 м
 
             Args:
                 db: SQLAlchemy-сессия
-                bbox: Объект с координатными границами
+                lat: Широта центра
+                lon: Долгота центра
+                r_m: Радиус в метрах
 
             Returns:
-                list[Building]: Здания внутри прямоугольника
+                list[tuple[Building, Organization | None]]: Пары здание/организация
         """
-        stmt = select(Building).where(
-            Building.lat.between(bbox.lat_min, bbox.lat_max),
-            Building.lon.between(bbox.lon_min, bbox.lon_max),
+        result = await db.execute(
+            _BUILDINGS_IN_RADIUS_STMT,
+            {"lat": lat, "lon": lon, "r_m": r_m},
         )
-        result = await db.execute(stmt)
-        return list(result.scalars().all())
+        return list(result.tuples().all())
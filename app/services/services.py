@@ -1,16 +1,62 @@
 """Сервисный слой"""
+from typing import Any
+
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.v1.geo import bbox_for_radius, bbox_for_rectangle, haversine_m
+from app.api.v1.geo import bbox_for_rectangle
+from app.core.cache import TTLCache, cached
 from app.models.models import Building, Organization
-from app.repo.repositories import BuildingsRepository, OrgsRepository
+from app.repo.repositories import BuildingsRepository, OrgRow, OrgsRepository
 from app.schemas.schemas import BuildingOut, GeoSearchOut, OrganizationOut
 
+# Ответы кэшируются не дольше _CACHE_TTL_S секунд: изменения в БД становятся
+# видны в ответах здания/активности/геопоиска не позже этого времени
+_CACHE_TTL_S = 30
+# Ограничение кэша по суммарному числу DTO(организаций и зданий) в ответах
+_CACHE_MAX_ITEMS = 50_000
+
+
+def payload_size(value: Any) -> int:
+    """
+        Вес закэшированного ответа: число DTO в нём, но не меньше 1
+
+        Args:
+            value: Список OrganizationOut или GeoSearchOut
+
+        Returns:
+            int: Число организаций и зданий в ответе
+    """
+    if isinstance(value, GeoSearchOut):
+        return max(1, len(value.organizations) + len(value.buildings))
+    if isinstance(value, list):
+        return max(1, len(value))
+    return 1
+
+
+def building_to_out(b: Building) -> BuildingOut:
+    """
+        Преобразует ORM-модель Building в публичную DTO-схему BuildingOut.
+        Данные из ORM уже типизированы, поэтому валидация пропускается
+
+        Args:
+            b: ORM-объект Building
+
+        Returns:
+            BuildingOut: DTO для ответа
+    """
+    return BuildingOut.model_construct(
+        id=b.id,
+        address=b.address,
+        lat=b.lat,
+        lon=b.lon,
+    )
+
 
 def org_to_out(o: Organization) -> OrganizationOut:
     """
-        Преобразует ORM-модель Organization в публичную DTO-схему OrganizationOut
+        Преобразует ORM-модель Organization в публичную DTO-схему OrganizationOut.
+        Данные из ORM уже типизированы, поэтому валидация пропускается
 
         Args:
             o: ORM-объект Organization
@@ -18,14 +64,62 @@ def org_to_out(o: Organization) -> OrganizationOut:
         Returns:
             OrganizationOut: DTO для ответа
     """
-    return OrganizationOut.model_validate(
-        obj={
-            "id": o.id,
-            "name": o.name,
-            "building": o.building, "phones": [p.phone for p in o.phones],
-            "activities": [a.name for a in o.activities],
-        },
-        from_attributes=True,
+    return OrganizationOut.model_construct(
+        id=o.id,
+        name=o.name,
+        building=building_to_out(o.building),
+        phones=[p.phone for p in o.phones],
+        activities=[a.name for a in o.activities],
+    )
+
+
+def row_to_out(r: OrgRow) -> OrganizationOut:
+    """
+        Собирает OrganizationOut из плоской строки запроса без ORM-гидрации
+
+        Args:
+            r: Строка id, name, building_id, address, lat, lon, phones, activities
+
+        Returns:
+            OrganizationOut: DTO для ответа
+    """
+    return OrganizationOut.model_construct(
+        id=r.id,
+        name=r.name,
+        building=BuildingOut.model_construct(
+            id=r.building_id,
+            address=r.address,
+            lat=r.lat,
+            lon=r.lon,
+        ),
+        phones=r.phones,
+        activities=r.activities,
+    )
+
+
+def geo_to_out(
+        rows: list[tuple[Building, Organization | None]],
+) -> GeoSearchOut:
+    """
+        Раскладывает пары здание/организация в ответ геопоиска
+
+        Args:
+            rows: Пары здание/организация(None для здания без организаций)
+
+        Returns:
+            GeoSearchOut: DTO для ответа
+    """
+    buildings: dict[int, BuildingOut] = {}
+    orgs: list[OrganizationOut] = []
+    for b, o in rows:
+        if b.id not in buildings:
+            buildings[b.id] = building_to_out(b)
+        if o is not None:
+            orgs.append(org_to_out(o))
+
+    return GeoSearchOut.model_construct(
+        organizations=orgs,
+        buildings=list(buildings.values()),
     )
 
 
@@ -36,27 +130,23 @@ class OrgsService:
         Args:
             orgs: Репозиторий организаций
             buildings: Репозиторий зданий
+            cache: Кэш ответов для повторяющихся запросов(здание/активность/геопоиск).
+                По умолчанию хранит до _CACHE_MAX_ITEMS DTO не дольше _CACHE_TTL_S
+                секунд, поэтому записи в БД видны в этих ответах с задержкой
+                до _CACHE_TTL_S
     """
     def __init__(
             self,
             orgs: OrgsRepository,
             buildings: BuildingsRepository,
+            cache: TTLCache | None = None,
     ) -> None:
         self.orgs = orgs
         self.buildings = buildings
-
-    async def _get_orgs_by_buildings(
-            self,
-            db: AsyncSession,
-            buildings: list[Building],
-    ) -> list[Organization]:
-        if not buildings:
-            return []
-
-        b_ids = [b.id for b in buildings]
-        return await self.orgs.orgs_by_building_ids(
-            db=db,
-            building_ids=b_ids,
+        self.cache = cache if cache is not None else TTLCache(
+            maxsize=_CACHE_MAX_ITEMS,
+            ttl=_CACHE_TTL_S,
+            weigh=payload_size,
         )
 
     async def get_organization(
@@ -103,12 +193,13 @@ class OrgsService:
             Returns:
                 list[OrganizationOut]: Список найденных организаций
         """
-        orgs = await self.orgs.search_orgs_by_name(
+        orgs = self.orgs.search_orgs_by_name(
             db=db,
             q=q,
         )
-        return [org_to_out(o) for o in orgs]
+        return [row_to_out(r) async for r in orgs]
 
+    @cached(key=lambda db, building_id: building_id)
     async def organizations_in_building(
             self,
             db: AsyncSession,
@@ -124,12 +215,13 @@ class OrgsService:
             Returns:
                 list[OrganizationOut]: Список организаций в здании
         """
-        orgs = await self.orgs.orgs_in_building(
+        orgs = self.orgs.orgs_in_building(
             db=db,
             building_id=building_id,
         )
-        return [org_to_out(o) for o in orgs]
+        return [row_to_out(r) async for r in orgs]
 
+    @cached(key=lambda db, activity_id: activity_id)
     async def organizations_by_activity(
             self,
             db: AsyncSession,
@@ -158,16 +250,13 @@ class OrgsService:
                 detail="Activity not found",
             )
 
-        ids = await self.orgs.activity_descendants_ids(
+        orgs = self.orgs.orgs_by_activity_tree(
             db=db,
             root_activity_id=activity_id,
         )
-        orgs = await self.orgs.orgs_by_activity_ids(
-            db=db,
-            activity_ids=ids,
-        )
-        return [org_to_out(o) for o in orgs]
+        return [row_to_out(r) async for r in orgs]
 
+    @cached(key=lambda db, lat, lon, r_m: (round(lat, 6), round(lon, 6), r_m))
     async def geo_radius(
             self,
             db: AsyncSession,
@@ -189,37 +278,17 @@ class OrgsService:
                     - buildings: здания, попавшие в радиус
                     - organizations: организации в этих зданиях
         """
-        bbox = bbox_for_radius(lat, lon, r_m)
-        buildings = await self.buildings.buildings_in_bbox(
+        rows = await self.buildings.buildings_with_orgs_in_radius(
             db=db,
-            bbox=bbox,
-        )
-        near = [b for b in buildings if haversine_m(
-            lat1=lat,
-            lon1=lon,
-            lat2=b.lat,
-            lon2=b.lon,
-        ) <= r_m]
-
-        if not near:
-            return GeoSearchOut(
-                organizations=[],
-                buildings=[],
-            )
-
-        orgs = await self._get_orgs_by_buildings(
-            db=db,
-            buildings=near,
-        )
-
-        return GeoSearchOut(
-            organizations=[org_to_out(o) for o in orgs],
-            buildings=[BuildingOut.model_validate(
-                obj=b,
-                from_attributes=True,
-            ) for b in near],
+            lat=lat,
+            lon=lon,
+            r_m=r_m,
         )
+        return geo_to_out(rows)
 
+    @cached(key=lambda db, lat1, lon1, lat2, lon2: (
+        round(lat1, 6), round(lon1, 6), round(lat2, 6), round(lon2, 6),
+    ))
     async def geo_rectangle(
             self,
             db: AsyncSession,
@@ -249,26 +318,8 @@ class OrgsService:
             lat2=lat2,
             lon2=lon2,
         )
-        buildings = await self.buildings.buildings_in_bbox(
+        rows = await self.buildings.buildings_with_orgs_in_bbox(
             db=db,
             bbox=bbox,
         )
-
-        if not buildings:
-            return GeoSearchOut(
-                organizations=[],
-                buildings=[],
-            )
-
-        orgs = await self._get_orgs_by_buildings(
-            db=db,
-            buildings=buildings,
-        )
-
-        return GeoSearchOut(
-            organizations=[org_to_out(o) for o in orgs],
-            buildings=[BuildingOut.model_validate(
-                obj=b,
-                from_attributes=True,
-            ) for b in buildings],
-        )
+        return geo_to_out(rows)
@@ -2,6 +2,9 @@
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.models import Activity, Building, Organization
 
 
 @pytest.mark.asyncio
@@ -15,3 +18,35 @@ async def test_activity_not_found(
         headers=auth_headers,
     )
     assert resp.status_code == 404
+
+@pytest.mark.asyncio
+async def test_activity_tree_depth(
+        client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers: dict[str, str],
+) -> None:
+    """
+        Цепочка из 4 уровней: организации уровней 1-3 возвращаются,
+        организация 4-го уровня нет, организация с двумя активностями
+        из дерева встречается один раз
+    """
+    level1 = Activity(name="Food")
+    level2 = Activity(name="Meat", parent=level1)
+    level3 = Activity(name="Beef", parent=level2)
+    level4 = Activity(name="Steak", parent=level3)
+    building = Building(address="addr", lat=0.0, lon=0.0)
+    db_session.add_all([
+        Organization(name="L1", building=building, activities=[level1]),
+        Organization(name="L2", building=building, activities=[level2]),
+        Organization(name="L3", building=building, activities=[level3]),
+        Organization(name="L4", building=building, activities=[level4]),
+        Organization(name="L1+L3", building=building, activities=[level1, level3]),
+    ])
+    await db_session.flush()
+
+    resp = await client.get(
+        url=f"/activities/{level1.id}/organizations",
+        headers=auth_headers,
+    )
+    assert resp.status_code == 200
+    assert sorted(o["name"] for o in resp.json()) == ["L1", "L1+L3", "L2", "L3"]
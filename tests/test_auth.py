@@ -21,3 +21,25 @@ async def test_wrong_key(client: AsyncClient) -> None:
         headers={"X-API-Key": "wrong"},
     )
     assert resp.status_code == 401
+
+@pytest.mark.asyncio
+async def test_unknown_path_not_found(client: AsyncClient) -> None:
+    """Несуществующий путь отдаёт 404 даже без API key"""
+    resp = await client.get(url="/no-such-path")
+    assert resp.status_code == 404
+
+@pytest.mark.asyncio
+async def test_openapi_security_scheme(client: AsyncClient) -> None:
+    """OpenAPI-схема описывает X-API-Key, чтобы /docs отправлял заголовок"""
+    resp = await client.get(url="/openapi.json")
+    schema = resp.json()
+    scheme = schema["components"]["securitySchemes"]["ApiKeyHeader"]
+    assert scheme == {"type": "apiKey", "in": "header", "name": "X-API-Key"}
+    assert schema["security"] == [{"ApiKeyHeader": []}]
+    assert schema["paths"]["/health"]["get"]["security"] == []
+
+@pytest.mark.asyncio
+async def test_wrong_method_not_allowed(client: AsyncClient) -> None:
+    """Неподдерживаемый метод на существующем пути отдаёт 405 даже без API key"""
+    resp = await client.post(url="/organizations/1")
+    assert resp.status_code == 405
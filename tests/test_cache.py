@@ -0,0 +1,42 @@
+"""Тесты in-process TTL-кэша"""
+from app.core.cache import TTLCache
+
+
+def test_ttl_expiry() -> None:
+    """Запись недоступна после истечения ttl"""
+    now = [100.0]
+    cache = TTLCache(maxsize=10, ttl=30, clock=lambda: now[0])
+    cache.set("k", "v")
+    assert cache.get("k") == "v"
+
+    now[0] = 131.0
+    assert cache.get("k") is None
+
+
+def test_lru_eviction() -> None:
+    """При переполнении вытесняется давно не использованная запись"""
+    cache = TTLCache(maxsize=2, ttl=30)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_weight_eviction() -> None:
+    """Кэш ограничен суммарным весом записей, а не их числом"""
+    cache = TTLCache(maxsize=5, ttl=30, weigh=len)
+    cache.set("a", [1, 2])
+    cache.set("b", [1, 2])
+    cache.set("c", [1, 2, 3])
+
+    assert cache.get("a") is None
+    assert cache.get("b") == [1, 2]
+    assert cache.get("c") == [1, 2, 3]
+
+    cache.set("huge", list(range(6)))
+    assert cache.get("huge") is None
+    assert cache.get("b") == [1, 2]
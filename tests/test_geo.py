@@ -2,6 +2,10 @@
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.api import _service
+from app.models.models import Activity, Building, Organization, OrganizationPhone
 
 
 @pytest.mark.asyncio
@@ -38,3 +42,87 @@ async def test_geo_empty(
     )
     assert resp.status_code == 200
     assert resp.json() == {"organizations": [], "buildings": []}
+
+@pytest.mark.asyncio
+async def test_geo_rectangle_sees_new_building(
+        client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers: dict[str, str],
+) -> None:
+    """
+        Ответ по прямоугольнику кэшируется сервисом, после очистки кэша
+        (как между тестами в clear_service_cache) добавленное здание
+        попадает в ответ
+    """
+    params = {
+        "lat1": 0,
+        "lon1": 0,
+        "lat2": 1,
+        "lon2": 1,
+    }
+    resp = await client.get(url="/geo/rectangle", params=params, headers=auth_headers)
+    assert resp.json()["buildings"] == []
+
+    db_session.add(Building(address="Center", lat=0.5, lon=0.5))
+    await db_session.flush()
+
+    resp = await client.get(url="/geo/rectangle", params=params, headers=auth_headers)
+    assert resp.json()["buildings"] == []
+
+    _service.cache.clear()
+    resp = await client.get(url="/geo/rectangle", params=params, headers=auth_headers)
+    assert resp.status_code == 200
+    assert [b["address"] for b in resp.json()["buildings"]] == ["Center"]
+
+@pytest.mark.asyncio
+async def test_geo_rectangle_buildings_and_orgs(
+        client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers: dict[str, str],
+) -> None:
+    """
+        Здание с двумя организациями попадает в ответ один раз,
+        здание без организаций тоже, организации возвращаются
+        с телефонами и деятельностями
+    """
+    busy = Building(address="Busy", lat=10.1, lon=20.1)
+    empty = Building(address="Empty", lat=10.2, lon=20.2)
+    db_session.add_all([
+        empty,
+        Organization(
+            name="First",
+            building=busy,
+            phones=[OrganizationPhone(phone="1-111-111")],
+            activities=[Activity(name="Food"), Activity(name="Cars")],
+        ),
+        Organization(
+            name="Second",
+            building=busy,
+            phones=[OrganizationPhone(phone="2-222-222")],
+            activities=[Activity(name="Milk")],
+        ),
+    ])
+    await db_session.flush()
+
+    resp = await client.get(
+        url="/geo/rectangle",
+        params={
+            "lat1": 10,
+            "lon1": 20,
+            "lat2": 11,
+            "lon2": 21,
+        },
+        headers=auth_headers,
+    )
+    assert resp.status_code == 200
+    body = resp.json()
+    assert sorted(b["address"] for b in body["buildings"]) == ["Busy", "Empty"]
+    orgs = {
+        o["name"]: (o["building"]["id"], o["phones"], sorted(o["activities"]))
+        for o in body["organizations"]
+    }
+    assert len(body["organizations"]) == 2
+    assert orgs == {
+        "First": (busy.id, ["1-111-111"], ["Cars", "Food"]),
+        "Second": (busy.id, ["2-222-222"], ["Milk"]),
+    }
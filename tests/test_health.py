@@ -1,12 +1,13 @@
 """Smoke-тест для проверки доступности сервиса"""
-from fastapi.testclient import TestClient
+import pytest
+from httpx import AsyncClient
 
-from app.api.v1.main import app
 
-
-def test_health() -> None:
+@pytest.mark.asyncio
+async def test_health(
+        base_client: AsyncClient,
+) -> None:
     """Health-check эндпоинта"""
-    client = TestClient(app=app)
-    resp = client.get(url="/health")
+    resp = await base_client.get(url="/health")
     assert resp.status_code == 200
     assert resp.json() == {"status": "ok"}
@@ -1,7 +1,12 @@
 """HTTP-тесты эндпоинтов, связанных с организациями"""
+from typing import Any
+from unittest.mock import ANY
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.models import Activity, Building, Organization, OrganizationPhone
 
 
 @pytest.mark.asyncio
@@ -34,3 +39,102 @@ async def test_get_organization(
         headers=auth_headers,
     )
     assert resp.status_code == 404
+
+
+async def _seed_building_with_orgs(db_session: AsyncSession) -> Building:
+    """
+        Здание с двумя организациями: с телефонами и деятельностями
+        и без них
+
+        Returns:
+            Building: Сохранённое здание
+    """
+    building = Building(address="Lenina 1", lat=55.75, lon=37.61)
+    db_session.add_all([
+        Organization(
+            name="Horns and Hooves",
+            building=building,
+            phones=[
+                OrganizationPhone(phone="2-222-222"),
+                OrganizationPhone(phone="3-333-333"),
+            ],
+            activities=[Activity(name="Food"), Activity(name="Cars")],
+        ),
+        Organization(
+            name="Hornless",
+            building=building,
+        ),
+    ])
+    await db_session.flush()
+    return building
+
+
+def _expected_orgs(building: Building) -> list[dict[str, Any]]:
+    """
+        Ожидаемый ответ для организаций из _seed_building_with_orgs
+
+        Returns:
+            list[dict[str, Any]]: Организации в порядке названия
+    """
+    building_out = {
+        "id": building.id,
+        "address": "Lenina 1",
+        "lat": 55.75,
+        "lon": 37.61,
+    }
+    return [
+        {
+            "id": ANY,
+            "name": "Hornless",
+            "building": building_out,
+            "phones": [],
+            "activities": [],
+        },
+        {
+            "id": ANY,
+            "name": "Horns and Hooves",
+            "building": building_out,
+            "phones": ["2-222-222", "3-333-333"],
+            "activities": ["Food", "Cars"],
+        },
+    ]
+
+
+@pytest.mark.asyncio
+async def test_search_with_rows(
+        client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers: dict[str, str],
+) -> None:
+    """
+        Поиск возвращает организации с телефонами, деятельностями и зданием,
+        у организации без телефонов и деятельностей это пустые списки
+    """
+    building = await _seed_building_with_orgs(db_session)
+
+    resp = await client.get(
+        url="/organizations/search",
+        params={"q": "horn"},
+        headers=auth_headers,
+    )
+    assert resp.status_code == 200
+    assert sorted(resp.json(), key=lambda o: o["name"]) == _expected_orgs(building)
+
+@pytest.mark.asyncio
+async def test_building_organizations(
+        client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers: dict[str, str],
+) -> None:
+    """
+        Организации здания возвращаются с телефонами, деятельностями и зданием,
+        у организации без телефонов и деятельностей это пустые списки
+    """
+    building = await _seed_building_with_orgs(db_session)
+
+    resp = await client.get(
+        url=f"/buildings/{building.id}/organizations",
+        headers=auth_headers,
+    )
+    assert resp.status_code == 200
+    assert sorted(resp.json(), key=lambda o: o["name"]) == _expected_orgs(building)
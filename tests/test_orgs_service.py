@@ -61,7 +61,7 @@ async def test_activity_not_found(
     fake_repo.activity_exists = AsyncMock(
         return_value=False,
     )
-    fake_repo.activity_descendants_ids = AsyncMock()
+    fake_repo.orgs_by_activity_tree = Mock()
 
     svc = OrgsService(
         orgs=fake_repo,
@@ -76,7 +76,7 @@ async def test_activity_not_found(
             activity_id=1,
         )
 
-    fake_repo.activity_descendants_ids.assert_not_called()
+    fake_repo.orgs_by_activity_tree.assert_not_called()
 
 @pytest.mark.asyncio
 async def test_search_validation(
@@ -92,3 +92,38 @@ async def test_search_validation(
         headers=auth_headers,
     )
     assert resp.status_code == 422
+
+@pytest.mark.asyncio
+async def test_geo_rectangle_cached(
+        mock_db: AsyncSession,
+) -> None:
+    """
+        Повторный геопоиск с теми же координатами берётся из кэша сервиса
+        и не обращается к репозиторию
+
+        Args: mock_db
+
+        Mock: buildings_repo.buildings_with_orgs_in_bbox
+    """
+    fake_buildings = Mock()
+    fake_buildings.buildings_with_orgs_in_bbox = AsyncMock(
+        return_value=[],
+    )
+
+    svc = OrgsService(
+        orgs=Mock(),
+        buildings=fake_buildings,
+    )
+
+    for _ in range(2):
+        res = await svc.geo_rectangle(
+            db=mock_db,
+            lat1=0,
+            lon1=0,
+            lat2=1,
+            lon2=1,
+        )
+        assert res.organizations == []
+        assert res.buildings == []
+
+    fake_buildings.buildings_with_orgs_in_bbox.assert_awaited_once()
@@ -0,0 +1,96 @@
+"""Интеграционные тесты слоя доступа к данным"""
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.models.models import (
+    Activity,
+    Building,
+    Organization,
+    OrganizationPhone,
+)
+from app.repo.repositories import BuildingsRepository, OrgsRepository
+
+
+@contextmanager
+def count_queries(engine: AsyncEngine) -> Iterator[list[str]]:
+    """
+        Собирает SQL-запросы, выполненные через engine внутри блока
+
+        Yields:
+            list[str]: Тексты выполненных запросов
+    """
+    statements: list[str] = []
+
+    def before_cursor_execute(*args: Any) -> None:
+        statements.append(args[2])
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.mark.asyncio
+async def test_get_org_by_id_query_count(
+        engine: AsyncEngine,
+        db_session: AsyncSession,
+) -> None:
+    """
+        get_org_by_id загружает организацию со зданием, телефонами и
+        активностями не более чем за 3 запроса
+    """
+    org = Organization(
+        name="Query count",
+        building=Building(address="addr", lat=0.0, lon=0.0),
+        phones=[OrganizationPhone(phone="1-111-111")],
+        activities=[Activity(name="Activity")],
+    )
+    db_session.add(org)
+    await db_session.flush()
+    db_session.expunge_all()
+
+    with count_queries(engine) as statements:
+        loaded = await OrgsRepository.get_org_by_id(
+            db=db_session,
+            org_id=org.id,
+        )
+
+    assert loaded is not None
+    assert loaded.building.address == "addr"
+    assert [p.phone for p in loaded.phones] == ["1-111-111"]
+    assert [a.name for a in loaded.activities] == ["Activity"]
+    assert len(statements) <= 3
+
+
+@pytest.mark.asyncio
+async def test_radius_boundary_uses_mean_earth_radius(
+        db_session: AsyncSession,
+) -> None:
+    """
+        Граница радиуса считается по среднему радиусу Земли 6371000 м:
+        0.01° по меридиану это 1111.95 м(на сфере earth() было бы 1113.20 м)
+    """
+    db_session.add(Building(address="edge", lat=0.01, lon=0.0))
+    await db_session.flush()
+
+    inside = await BuildingsRepository.buildings_with_orgs_in_radius(
+        db=db_session,
+        lat=0.0,
+        lon=0.0,
+        r_m=1112.5,
+    )
+    outside = await BuildingsRepository.buildings_with_orgs_in_radius(
+        db=db_session,
+        lat=0.0,
+        lon=0.0,
+        r_m=1111.5,
+    )
+
+    assert [b.address for b, _ in inside] == ["edge"]
+    assert outside == []